@@ -1,15 +1,23 @@
+from functools import cache
 from pathlib import Path
 from typing import Any
 
-from data_pull_tools.toml_utils import CachedTOMLReader
+from data_pull_tools.toml_utils import load_toml
 from git.repo import Repo
 
-_reader = CachedTOMLReader()
 _project_root = Path(__file__).parent.parent
 
 
+@cache
 def load_pyproject() -> dict[str, Any]:
-    return _reader.load(_project_root / "pyproject.toml")
+    # Read and parsed once per process, every deploy step shares the result
+    return load_toml(_project_root / "pyproject.toml")
+
+
+@cache
+def _repo() -> Repo:
+    # Reads the git config and scans .git once per process
+    return Repo(_project_root)
 
 
 def v_tag_name(poetry) -> str:
@@ -19,7 +27,7 @@ def v_tag_name(poetry) -> str:
 def deploy() -> bool:
     poetry = load_pyproject()["tool"]["poetry"]
 
-    repo = Repo(_project_root)
+    repo = _repo()
     tag_name = v_tag_name(poetry)
     repo.create_tag(tag_name)
     repo.remotes.origin.push(tag_name)
@@ -29,7 +37,7 @@ def deploy() -> bool:
 
 def poe_can_deploy() -> None:
     """Raise a SystemExit error if poe should not deploy the package."""
-    repo = Repo(_project_root)
+    repo = _repo()
     poetry = load_pyproject()["tool"]["poetry"]
 
     if repo.is_dirty():
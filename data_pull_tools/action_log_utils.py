@@ -15,6 +15,7 @@
     ExcelReader,
     ResolveStrategyType,
 )
+from data_pull_tools.output_utils import check_output_path, write_output
 
 if TYPE_CHECKING:
     from pandas import DataFrame
@@ -38,15 +39,35 @@
 ]
 
 
+# Source column for each output column
+_in_cols = [
+    next((src for src, dst in renamer.items() if dst == col), col) for col in out_cols
+]
+
+# Only these columns are parsed out of each sheet
+_usecols = frozenset(_in_cols)
+
+
 def _rename_columns(df: DataFrame) -> DataFrame:
-    return df.rename(columns=renamer)[out_cols]
+    # Select first so only the kept columns are relabelled
+    df = df[_in_cols]
+    df.columns = out_cols
+    return df
+
+
+# Built once and shared by every call
+_renaming_cacher = DEFAULT_CACHER(
+    pre_process=_rename_columns,
+)
 
 
 def process_action_logs(
     process_root: Path,
+    output_path: Path | None = None,
 ) -> None:
     """
-    Process action logs from Excel files and save the result to a CSV file.
+    Process action logs from Excel files and save the result to a CSV or Parquet
+    file.
 
     Parameters
     ----------
@@ -55,31 +76,43 @@ def process_action_logs(
     process_root : Path
         The root path for processing, either the batch directory or a
         single file.
+    output_path : Path | None, optional
+        Where to write the result, by default "action_logs.csv" in the user's
+        downloads directory. The format is chosen by the file extension, either
+        ".csv" or ".parquet".
 
     Returns
     -------
     None
 
+    Raises
+    ------
+    NotImplementedError
+        If `output_path` has an unsupported file extension, raised before any
+        action logs are read.
+
     Examples
     --------
     >>> process_action_logs(ProcessMode.BATCH, Path("data/batch_logs"))
 
     >>> process_action_logs(ProcessMode.SINGLE, Path("data/single_log.xlsx"))
     """
+    # Fail before reading, rather than after all the work is done
+    output_path = check_output_path(
+        output_path or Path(user_downloads_dir()) / "action_logs.csv",
+    )
+
     module_logger.info("Reading action logs from '%s'", process_root)
     st_time: float = timeit.default_timer()
 
-    renaming_cacher = DEFAULT_CACHER(
-        pre_process=_rename_columns,
-    )
-
     if process_root.is_dir():
         action_logs = ExcelCollector(
             root_dir=process_root,
             cache_dir="action_logs",
             cache_resolver=ResolveStrategyType.RESOLVE_TO_SYSTEM,
         ).collect(
-            cacher=renaming_cacher,
+            cacher=_renaming_cacher,
+            usecols=_usecols.__contains__,
         )
     elif process_root.is_file():
         action_logs = ExcelReader(
@@ -88,7 +121,8 @@ def process_action_logs(
             cache_resolver=ResolveStrategyType.RESOLVE_TO_SYSTEM,
         ).read_excel(
             input_file=process_root.name,
-            cacher=renaming_cacher,
+            cacher=_renaming_cacher,
+            usecols=_usecols.__contains__,
         )
     else:
         msg = "process_root of '%s' not supported."
@@ -99,9 +133,9 @@ def process_action_logs(
     noun: str = "row" if n_read == 1 else "rows"
     module_logger.info("Read %d %s in %.3fs", n_read, noun, elapsed)
 
-    module_logger.info("Writing action logs to CSV")
+    module_logger.info("Writing action logs to '%s'", output_path)
     st_time: float = timeit.default_timer()
-    action_logs.to_csv(Path(user_downloads_dir()) / "action_logs.csv", index=True)
+    write_output(action_logs, output_path, index=True)
     elapsed: float = timeit.default_timer() - st_time
     module_logger.info("Output written in %.3fs", elapsed)
 
@@ -2,19 +2,22 @@
 
 from data_pull_tools.infer_index import CleaningInferrer
 
+# Shared so its cleaned label cache carries over between calls
+_inferrer = CleaningInferrer()
 
-def unstack_age_details(df: DataFrame) -> DataFrame:
-    inferrer = CleaningInferrer()
-    df = inferrer.infer_index(df)  # type: ignore
-    df = df.dropna(how="all").T.unstack(0).T  # type: ignore
 
-    # Fix multi-index
-    mi: MultiIndex = df.index.copy()  # type: ignore
-    names = list(mi.names)
-    names[-1] = "Age Group"
-    mi: MultiIndex = mi.rename(names)
+def unstack_age_details(df: DataFrame) -> DataFrame:
+    df = _inferrer.infer_index(df)  # type: ignore
+    # Move the age groups from the columns into the index, without transposing
+    # the whole frame twice
+    df = df.dropna(how="all").stack(level=0, future_stack=True)  # type: ignore
 
-    # Convert "Record ID" to numeric
-    mi = mi.set_levels(mi.levels[0].astype(int), level=0)
+    # Fix multi-index, converting "Record ID" to numeric
+    # Only the distinct IDs in the level are cast, the row codes are reused
+    mi: MultiIndex = df.index  # type: ignore
+    df.index = mi.set_levels(mi.levels[0].astype(int), level=0).set_names(
+        "Age Group",
+        level=-1,
+    )
 
-    return df.set_index(mi)
+    return df
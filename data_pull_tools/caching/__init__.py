@@ -11,9 +11,10 @@
     Cacher,
     CSVCacher,
     ParquetCacher,
+    obj_cols_to_str,
 )
 from .excel_collector import ExcelCollector
-from .excel_reader import ExcelReader
+from .excel_reader import DEFAULT_EXCEL_ENGINE, ExcelReader
 from .resolve_strategy import (
     DEFAULT_CACHE_DIR,
     DEFAULT_RESOLVE_STRATEGY,
@@ -46,9 +47,11 @@
     "Cacher",
     "CSVCacher",
     "ParquetCacher",
+    "obj_cols_to_str",
     # excel_collector
     "ExcelCollector",
     # excel_reader
+    "DEFAULT_EXCEL_ENGINE",
     "ExcelReader",
     # resolve_strategy
     "DEFAULT_CACHE_DIR",
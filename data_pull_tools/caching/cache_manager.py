@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import stat
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -60,11 +61,14 @@ def _validate_root_dir(root_dir: Pathish | None) -> Path:
         """
         root_dir = Path() if root_dir is None else Path(root_dir)
 
-        if not root_dir.exists():
+        # One stat answers both checks
+        try:
+            st_mode = root_dir.stat().st_mode
+        except (FileNotFoundError, NotADirectoryError):
             err = make_file_not_found_error(root_dir)
-            raise err
+            raise err from None
 
-        if not root_dir.is_dir():
+        if not stat.S_ISDIR(st_mode):
             msg = "'root_dir' must be a directory, received: %s"
             raise TypeError(msg, root_dir)
 
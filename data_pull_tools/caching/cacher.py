@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import json
 import logging
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 import pandas as pd
 
@@ -15,6 +16,38 @@
 module_logger = logging.getLogger(__name__)
 
 
+def _nested_to_json(value: object) -> object:
+    # Parquet cannot store list or dict cells in a string column
+    if isinstance(value, list | dict):
+        return json.dumps(value)
+    return value
+
+
+def obj_cols_to_str(df: DataFrame) -> DataFrame:
+    """Converts a DataFrame's object columns to strings columns.
+    Necessary for Parquet, which does not support object columns.
+    List and dict cells are written as JSON.
+
+    Parameters
+    ----------
+    df: DataFrame
+        Input dataframe.
+
+    Returns
+    -------
+    DataFrame
+        Dataframe with object columns converted to strings.
+    """
+    df = df.convert_dtypes()
+    obj_cols = df.select_dtypes(include="object").columns
+    if len(obj_cols) > 0:
+        # The string dtype maps every missing value to NA in the same pass
+        df[obj_cols] = (
+            df[obj_cols].apply(lambda col: col.map(_nested_to_json)).astype("string")
+        )
+    return df
+
+
 class Cacher(ABC):
     """Abstract base class for caching dataframes.
 
@@ -26,6 +59,9 @@ class Cacher(ABC):
         Function to postprocess the dataframe after caching, by default None
     """
 
+    suffix: ClassVar[str]
+    """The file suffix/extension for the cache file, set by each subclass."""
+
     def __init__(
         self,
         pre_process: Processor | MutableSequence[Processor] | None = None,
@@ -38,12 +74,6 @@ def __init__(
         self._pre_process = pre_process
         self._post_process = post_process
 
-    @property
-    @abstractmethod
-    def suffix(self) -> str:
-        """Get the file suffix/extension for the cache file."""
-        ...
-
     def pre_process(self, df: DataFrame) -> DataFrame:
         """Apply any registered pre-processors to the DataFrame.
 
@@ -166,9 +196,12 @@ def cache_hit(self, input_file: Path, cache_file: Path) -> bool:
         bool
             True if the input_file has a valid cache, False otherwise.
         """
-        return cache_file.exists() and (
-            input_file.stat().st_mtime < cache_file.stat().st_mtime
-        )
+        # One stat per file, a missing cache file is simply a miss
+        try:
+            cache_st_mtime = cache_file.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        return input_file.stat().st_mtime < cache_st_mtime
 
     def cache_miss(self, input_file: Path, cache_file: Path) -> bool:
         """Checks if the input file is already cached.
@@ -198,41 +231,36 @@ class ParquetCacher(Cacher):
         Function to preprocess the dataframe before caching, by default None
     post_process: Processor | MutableSequence[Processor] | None, optional
         Function to postprocess the dataframe after caching, by default None
+    compression: str | None, optional
+        Compression codec for the cache file, by default "zstd".
+        Any codec supported by fastparquet, or None for no compression.
     """
 
-    def pre_process(self, df: DataFrame) -> DataFrame:  # noqa: D102
-        df = super().pre_process(df)  # noqa: PD901
-        return self._obj_cols_to_str(df)
-
-    def _obj_cols_to_str(self, df: DataFrame) -> DataFrame:
-        """Converts a DataFrame's object columns to strings columns.
-        Necessary for caching as Parquet does not support object columns.
+    suffix = ".parquet"
 
-        Parameters
-        ----------
-        df: DataFrame
-            Input dataframe.
-
-        Returns
-        -------
-        DataFrame
-            Dataframe with object columns converted to strings.
-        """
-        df = df.convert_dtypes()
-        obj_cols = df.select_dtypes(include="object").columns
-        df[obj_cols] = df[obj_cols].astype(str)
-        df[obj_cols] = df[obj_cols].replace("nan", pd.NA)
-        return df
+    def __init__(
+        self,
+        pre_process: Processor | MutableSequence[Processor] | None = None,
+        post_process: Processor | MutableSequence[Processor] | None = None,
+        compression: str | None = "zstd",
+    ) -> None:
+        super().__init__(pre_process=pre_process, post_process=post_process)
+        self.compression = compression
 
-    @property
-    def suffix(self) -> str:  # noqa: D102
-        return ".parquet"
+    def pre_process(self, df: DataFrame) -> DataFrame:  # noqa: D102
+        df = super().pre_process(df)  # noqa: PD901
+        return obj_cols_to_str(df)
 
     def _read_cache(self, cache_file: Path) -> DataFrame:
-        return pd.read_parquet(cache_file)
+        # Name the engine, "auto" retries the missing pyarrow import on every read
+        return pd.read_parquet(cache_file, engine="fastparquet")
 
     def _write_cache(self, cache_file: Path, df: DataFrame) -> None:
-        df.to_parquet(cache_file)
+        df.to_parquet(
+            cache_file,
+            engine="fastparquet",
+            compression=self.compression,
+        )
 
 
 class CSVCacher(Cacher):
@@ -246,9 +274,7 @@ class CSVCacher(Cacher):
         Function to postprocess the dataframe after caching, by default None
     """
 
-    @property
-    def suffix(self) -> str:  # noqa: D102
-        return ".csv"
+    suffix = ".csv"
 
     def _read_cache(self, cache_file: Path) -> DataFrame:
         return pd.read_csv(cache_file)
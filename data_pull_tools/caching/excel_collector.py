@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import logging
-import multiprocessing as mp
-from functools import partial
+import os
+from fnmatch import fnmatch
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pandas as pd
@@ -10,10 +11,12 @@
 from .cache_manager import CacheManager
 from .cache_strategy import CacheStrategy, CacheStrategyType
 from .cacher import DEFAULT_CACHER
-from .excel_reader import ExcelReader
+from .excel_reader import DEFAULT_EXCEL_ENGINE, ExcelReader
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Iterator
+
+    from pandas._typing import DtypeArg, UsecolsArgType
 
     from . import Cacher, DataFrame, Pathish, ResolveStrategy
 
@@ -22,7 +25,10 @@
 
 
 def _drop_empty(df: DataFrame) -> DataFrame:
-    return df.convert_dtypes().dropna(how="all", axis=1).dropna(how="all", axis=0)
+    # One null-mask pass drives both the column and the row filter
+    # Nullable dtypes are inferred once on the concatenated result
+    not_na = df.notna()
+    return df.loc[not_na.any(axis=1), not_na.any(axis=0)]
 
 
 class ExcelCollector(CacheManager):
@@ -109,9 +115,9 @@ def output_path(self) -> Path:
         return self._output_path
 
     def _update_st_mtime(self) -> float | None:
-        if self.output_path.exists():
+        try:
             self._out_st_mtime = self.output_path.stat().st_mtime
-        else:
+        except FileNotFoundError:
             self._out_st_mtime = None
         return self._out_st_mtime
 
@@ -119,56 +125,64 @@ def _update_st_mtime(self) -> float | None:
     def out_st_mtime(self) -> float:
         return self._out_st_mtime or self._update_st_mtime() or 0.0
 
+    def _input_entries(self) -> Iterator[os.DirEntry[str] | Path]:
+        if any(sep in self.glob_pattern for sep in ("/", os.sep, "**")):
+            for path in self.root_dir.glob(self.glob_pattern):
+                if path.is_file() and path != self.output_path:
+                    yield path
+            return
+
+        # A single directory listing, each entry already knows its file type
+        # (and on Windows its stat) so network shares aren't queried per file
+        output_path = os.fspath(self.output_path)
+        with os.scandir(self.root_dir) as entries:
+            for entry in entries:
+                if (
+                    fnmatch(entry.name, self.glob_pattern)
+                    and entry.is_file()
+                    and entry.path != output_path
+                ):
+                    yield entry
+
     @property
     def _should_collect(self) -> bool:
-        if not self.output_path.exists():
+        # Refresh the output's mtime, a missing output always needs collecting
+        out_st_mtime = self._update_st_mtime()
+        if out_st_mtime is None:
             return True
 
-        for entry in self.root_dir.glob(self.glob_pattern):
-            if (
-                entry.is_file()
-                and entry != self.output_path
-                and entry.stat().st_mtime > self.out_st_mtime
-            ):
-                return True
-
-        return False
+        return any(
+            entry.stat().st_mtime > out_st_mtime for entry in self._input_entries()
+        )
 
-    def _perform_collect(
+    def _perform_collect(  # noqa: PLR0913
         self,
         reader: ExcelReader | None,
         cacher: Cacher,
         strategy: CacheStrategy,
+        engine: str | None,
+        dtype: DtypeArg | None,
+        usecols: str | UsecolsArgType,
     ) -> DataFrame:
         module_logger.info("Reading input file(s)")
         reader = reader or self.reader
 
-        read_func = partial(
-            reader.read_excel,
-            sheet_name=self.sheet_name,
+        entries = [Path(entry) for entry in self._input_entries()]
+        raw_frames = reader.read_excels(
+            entries,
+            self.sheet_name,
             cacher=cacher,
             strategy=strategy,
+            engine=engine,
+            dtype=dtype,
+            usecols=usecols,
         )
-        entries = [
-            entry
-            for entry in self.root_dir.glob(self.glob_pattern)
-            if entry.is_file() and entry != self.output_path
-        ]
-
-        with mp.Pool() as pool:
-            raw_frames = pool.map(read_func, entries)
-
-        def _valid_frame(df: DataFrame) -> bool:
-            return (not df.empty) and (df.notna().any().any())
 
         frames = []
         for frame in raw_frames:
-            if isinstance(frame, dict):
-                frames.extend(
-                    [_drop_empty(df) for df in frame.values() if _valid_frame(df)],
-                )
-            elif _valid_frame(frame):
-                frames.append(_drop_empty(frame))
+            sheets = frame.values() if isinstance(frame, dict) else [frame]
+            # Frames without any data are empty once their blanks are dropped
+            frames.extend(df for df in map(_drop_empty, sheets) if not df.empty)
 
         if len(frames) == 0:
             module_logger.info("No data collected.")
@@ -181,15 +195,26 @@ def _valid_frame(df: DataFrame) -> bool:
         self._update_st_mtime()
         return collected
 
-    def collect(
+    def collect(  # noqa: PLR0913
         self,
         reader: ExcelReader | None = None,
         cacher: Cacher | None = None,
         strategy: CacheStrategy = CacheStrategyType.CHECK_CACHE,
+        *,
+        engine: str | None = DEFAULT_EXCEL_ENGINE,
+        dtype: DtypeArg | None = None,
+        usecols: str | UsecolsArgType = None,
     ) -> DataFrame:
         module_logger.info("Collecting Excel files.")
         if self._should_collect:
             cacher = cacher or DEFAULT_CACHER()
-            return self._perform_collect(reader, cacher, strategy)
+            return self._perform_collect(
+                reader,
+                cacher,
+                strategy,
+                engine,
+                dtype,
+                usecols,
+            )
 
         return self.cacher.read_cache(self.output_path)
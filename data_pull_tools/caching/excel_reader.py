@@ -2,7 +2,11 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing as mp
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from functools import partial
+from importlib.util import find_spec
 from typing import TYPE_CHECKING, overload
 
 import pandas as pd
@@ -14,15 +18,47 @@
 from .cacher import DEFAULT_CACHER, Cacher
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from pathlib import Path
     from typing import IO
 
+    from pandas._typing import DtypeArg, UsecolsArgType
+
     from . import DataFrame, Pathish
 
 IntStr = int | str
 
 module_logger = logging.getLogger(__name__)
 
+# Prefer the Rust-backed calamine parser when it is installed (the "calamine" extra),
+# otherwise let pandas pick its default engine (openpyxl for xlsx/xlsm, read-only)
+DEFAULT_EXCEL_ENGINE: str | None = "calamine" if find_spec("python_calamine") else None
+
+
+class _LazyExcelFile:
+    """An Excel workbook that is only loaded on the first parse, then shared by every
+    sheet parsed from it. Sheets served from the cache never load the workbook.
+    """
+
+    def __init__(self, file_handle: IO[bytes], engine: str | None) -> None:
+        self._file_handle = file_handle
+        self._engine = engine
+        self._excel_file: pd.ExcelFile | None = None
+
+    def parse(
+        self,
+        sheet_name: IntStr,
+        dtype: DtypeArg | None,
+        usecols: str | UsecolsArgType,
+    ) -> DataFrame:
+        if self._excel_file is None:
+            self._excel_file = pd.ExcelFile(self._file_handle, engine=self._engine)
+        return self._excel_file.parse(sheet_name, dtype=dtype, usecols=usecols)
+
+    def close(self) -> None:
+        if self._excel_file is not None:
+            self._excel_file.close()
+
 
 class ExcelReader(CacheManager):
     """Reads and caches Excel sheet data in alternative formats
@@ -35,15 +71,24 @@ def _read_excel_sheet(  # noqa: PLR0913
         sheet_name: IntStr,
         cacher: Cacher,
         strategy: CacheStrategy,
-        open_handle: IO[bytes] | None = None,
+        engine: str | None,
+        dtype: DtypeArg | None,
+        usecols: str | UsecolsArgType,
+        workbook: _LazyExcelFile | None = None,
     ) -> DataFrame:
         cache_file = self.output_path(f"{input_file.stem}-{sheet_name}", cacher)
 
-        reader = partial(
-            pd.read_excel,
-            open_handle or input_file,
-            sheet_name=sheet_name,
-        )
+        if workbook is not None:
+            reader = partial(workbook.parse, sheet_name, dtype=dtype, usecols=usecols)
+        else:
+            reader = partial(
+                pd.read_excel,
+                input_file,
+                sheet_name=sheet_name,
+                engine=engine,
+                dtype=dtype,
+                usecols=usecols,
+            )
         return strategy(
             input_file=input_file,
             cache_file=cache_file,
@@ -51,14 +96,20 @@ def _read_excel_sheet(  # noqa: PLR0913
             reader=reader,
         )
 
-    def _read_excel_sheets(
+    def _read_excel_sheets(  # noqa: PLR0913
         self,
         input_file: Path,
         sheet_name: list[IntStr] | None,
         cacher: Cacher,
         strategy: CacheStrategy,
+        engine: str | None,
+        dtype: DtypeArg | None,
+        usecols: str | UsecolsArgType,
     ) -> dict[IntStr, DataFrame]:
-        with input_file.open("rb") as file_handle:
+        with (
+            input_file.open("rb") as file_handle,
+            closing(_LazyExcelFile(file_handle, engine)) as workbook,
+        ):
             names = (
                 get_sheet_names(input_file, file_handle)
                 if sheet_name is None
@@ -70,7 +121,10 @@ def _read_excel_sheets(
                     sheet_name=name,
                     cacher=cacher,
                     strategy=strategy,
-                    open_handle=file_handle,
+                    engine=engine,
+                    dtype=dtype,
+                    usecols=usecols,
+                    workbook=workbook,
                 )
                 for name in names
             }
@@ -83,6 +137,9 @@ def read_excel(
         *,
         cacher: Cacher | None = None,
         strategy: CacheStrategy = DEFAULT_CACHE_STRATEGY,
+        engine: str | None = DEFAULT_EXCEL_ENGINE,
+        dtype: DtypeArg | None = None,
+        usecols: str | UsecolsArgType = None,
     ) -> DataFrame:
         ...
 
@@ -94,6 +151,9 @@ def read_excel(
         *,
         cacher: Cacher | None = None,
         strategy: CacheStrategy = DEFAULT_CACHE_STRATEGY,
+        engine: str | None = DEFAULT_EXCEL_ENGINE,
+        dtype: DtypeArg | None = None,
+        usecols: str | UsecolsArgType = None,
     ) -> dict[IntStr, DataFrame]:
         ...
 
@@ -105,16 +165,22 @@ def read_excel(
         *,
         cacher: Cacher | None = None,
         strategy: CacheStrategy = DEFAULT_CACHE_STRATEGY,
+        engine: str | None = DEFAULT_EXCEL_ENGINE,
+        dtype: DtypeArg | None = None,
+        usecols: str | UsecolsArgType = None,
     ) -> DataFrame | dict[IntStr, DataFrame]:
         ...
 
-    def read_excel(
+    def read_excel(  # noqa: PLR0913
         self,
         input_file: Pathish,
         sheet_name: IntStr | list[IntStr] | None = 0,
         *,
         cacher: Cacher | None = None,
         strategy: CacheStrategy = DEFAULT_CACHE_STRATEGY,
+        engine: str | None = DEFAULT_EXCEL_ENGINE,
+        dtype: DtypeArg | None = None,
+        usecols: str | UsecolsArgType = None,
     ) -> DataFrame | dict[IntStr, DataFrame]:
         """Read an Excel file and cache the result.
 
@@ -131,6 +197,20 @@ def read_excel(
             A callable that determines how the input and cache are handled.
             See `cache_strategy` for more information and an enumeration of default
             strategies.
+        engine: str | None, default DEFAULT_EXCEL_ENGINE
+            The engine pandas uses to parse the Excel file. Defaults to "calamine"
+            when python-calamine is installed, otherwise pandas' own default.
+        dtype: DtypeArg | None, default None
+            Data type(s) to apply while parsing, either a single type or a mapping
+            of column name to type. Unlisted columns are inferred by pandas.
+            Cache files are keyed on file and sheet, so changing `dtype` does not
+            invalidate an existing cache.
+        usecols: str | UsecolsArgType, default None
+            Columns to parse, passed through to `pandas.read_excel`. Either Excel
+            column letters and ranges (e.g. "A:E"), a list of column labels or
+            positions, or a callable evaluated against each column label. Columns
+            left out are skipped while parsing, rather than loaded and dropped.
+            As with `dtype`, changing `usecols` does not invalidate an existing cache.
 
         Returns
         -------
@@ -161,6 +241,9 @@ def read_excel(
                 sheet_name=sheet_name,
                 cacher=cacher,
                 strategy=strategy,
+                engine=engine,
+                dtype=dtype,
+                usecols=usecols,
             )
 
         return self._read_excel_sheets(
@@ -168,4 +251,74 @@ def read_excel(
             sheet_name=sheet_name,
             cacher=cacher,
             strategy=strategy,
+            engine=engine,
+            dtype=dtype,
+            usecols=usecols,
+        )
+
+    def read_excels(  # noqa: PLR0913
+        self,
+        input_files: Sequence[Pathish],
+        sheet_name: IntStr | list[IntStr] | None = 0,
+        *,
+        cacher: Cacher | None = None,
+        strategy: CacheStrategy = DEFAULT_CACHE_STRATEGY,
+        engine: str | None = DEFAULT_EXCEL_ENGINE,
+        dtype: DtypeArg | None = None,
+        usecols: str | UsecolsArgType = None,
+    ) -> list[DataFrame | dict[IntStr, DataFrame]]:
+        """Read several Excel files in parallel and cache the results.
+
+        With the calamine engine, which decodes sheets without holding the GIL, the
+        files are read in worker threads. Other engines parse in Python, so the files
+        are read in worker processes instead.
+
+        Parameters
+        ----------
+        input_files : Sequence[Pathish]
+            The input file paths.
+        sheet_name : IntStr | list[IntStr] | None, default 0
+            The sheet(s) to read from every file, see `read_excel`.
+        cacher: Cacher, default DEFAULT_CACHER
+            The cacher object for cache operations. It must be picklable unless
+            `engine` is "calamine".
+        strategy: CacheStrategy, default DEFAULT_STRATEGY
+            A callable that determines how the input and cache are handled.
+        engine: str | None, default DEFAULT_EXCEL_ENGINE
+            The engine pandas uses to parse the Excel files.
+        dtype: DtypeArg | None, default None
+            Data type(s) to apply while parsing, see `read_excel`.
+        usecols: str | UsecolsArgType, default None
+            Columns to parse, see `read_excel`.
+
+        Returns
+        -------
+        list[DataFrame | dict[IntStr, DataFrame]]
+            The result of `read_excel` for each input file, in the same order.
+            Frames read in a worker process are pickled back to the calling process.
+        """
+        read_func = partial(
+            self.read_excel,
+            sheet_name=sheet_name,
+            cacher=cacher,
+            strategy=strategy,
+            engine=engine,
+            dtype=dtype,
+            usecols=usecols,
         )
+
+        if len(input_files) <= 1:
+            # Not worth spinning up worker processes for a single file
+            return [read_func(input_file) for input_file in input_files]
+
+        if engine == "calamine":
+            # Threads overlap the GIL-free decodes and share the frames directly
+            workers = min(len(input_files), 32, mp.cpu_count() * 2)
+            with ThreadPoolExecutor(workers) as executor:
+                return list(executor.map(read_func, input_files))
+
+        processes = min(len(input_files), mp.cpu_count())
+        with mp.Pool(processes) as pool:
+            # Workbooks vary widely in parse time, hand them out one at a time
+            # so a batch of large files can't pile up behind a single worker
+            return pool.map(read_func, input_files, chunksize=1)
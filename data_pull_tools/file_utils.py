@@ -5,6 +5,7 @@
 import logging
 import os
 import shutil
+import stat
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -65,25 +66,29 @@ def hide_file(path: Pathish) -> Path:
     return path
 
 
+def _remove_entry(entry: os.DirEntry[str]) -> None:
+    # DirEntry caches the type from the directory listing, so no extra stat
+    if entry.is_dir(follow_symlinks=False):
+        shutil.rmtree(entry.path)
+    else:
+        os.unlink(entry.path)  # noqa: PTH108
+
+
 def _clear_dir(path: Path) -> None:
-    for entry in path.iterdir():
-        if entry.is_dir():
-            shutil.rmtree(entry)
-        else:
-            entry.unlink()
+    with os.scandir(path) as entries:
+        for entry in entries:
+            _remove_entry(entry)
 
 
 def _try_clear_dir(path: Path) -> list[Path]:
     lack_permissions = []
-    for entry in path.iterdir():
-        try:
-            if entry.is_dir():
-                shutil.rmtree(entry)
-            else:
-                entry.unlink()
-        except PermissionError as e:
-            module_logger.warning("Failed to delete %s.", entry, exc_info=e)
-            lack_permissions.append(entry)
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                _remove_entry(entry)
+            except PermissionError as e:
+                module_logger.warning("Failed to delete %s.", entry.path, exc_info=e)
+                lack_permissions.append(Path(entry.path))
     return lack_permissions
 
 
@@ -106,12 +111,15 @@ def clear_dir(
     """
     path = Path(path)
 
-    if not path.exists():
+    # One stat answers both checks
+    try:
+        st_mode = path.stat().st_mode
+    except (FileNotFoundError, NotADirectoryError):
         if must_exist:
-            raise make_file_not_found_error(path)
+            raise make_file_not_found_error(path) from None
         return []
 
-    if not path.is_dir():
+    if not stat.S_ISDIR(st_mode):
         msg = "'path' must be a directory."
         raise TypeError(msg)
 
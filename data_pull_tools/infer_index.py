@@ -1,11 +1,14 @@
 import re
 from abc import ABC, abstractmethod
-from collections import defaultdict
 from collections.abc import Callable
 from re import Match
 
+import numpy as np
 import pandas as pd
 
+# Suffix pandas appends to repeated column names, e.g. "Rate.1"
+_REPEAT_SUFFIX_PATTERN = re.compile(r"\.\d+$")
+
 
 class IndexInferrer(ABC):
     @abstractmethod
@@ -15,13 +18,22 @@ def infer_index(self, df: pd.DataFrame) -> pd.DataFrame | pd.Series: ...
 class CleaningInferrer(IndexInferrer):
     def __init__(
         self,
-        pattern: str | re.Pattern[str] | None = r"\.\d+$",
+        pattern: str | re.Pattern[str] | None = _REPEAT_SUFFIX_PATTERN,
         repl: str | Callable[[Match[str]], str] = "",
     ) -> None:
         if isinstance(pattern, str):
             pattern = re.compile(pattern)
         self._pattern = pattern
         self._repl = repl
+        # Column names and header labels repeat heavily across cells and sheets
+        self._sub_cache: dict[str, str] = {}
+
+    def _clean(self, value: str) -> str:
+        cleaned = self._sub_cache.get(value)
+        if cleaned is None:
+            cleaned = self._pattern.sub(self._repl, value)  # type: ignore
+            self._sub_cache[value] = cleaned
+        return cleaned
 
     def infer_index(self, df: pd.DataFrame | pd.Series) -> pd.DataFrame | pd.Series:
         # Bail early if it's a series by mistake!
@@ -34,14 +46,14 @@ def infer_index(self, df: pd.DataFrame | pd.Series) -> pd.DataFrame | pd.Series:
     def _infer_column_index(self, df: pd.DataFrame) -> pd.DataFrame:
         index_cols: list[int]
 
-        pattern = self._pattern
-        repl = self._repl
-
         # Clean column names
         cols_list = df.columns.to_list()
-        if pattern is not None:
-            cols_list = [pattern.sub(repl, x) for x in cols_list]
-            df.columns = cols_list  # type: ignore
+        if self._pattern is not None:
+            cleaned = [self._clean(x) for x in cols_list]
+            # Already clean sheets keep their column index as is
+            if cleaned != cols_list:
+                cols_list = cleaned
+                df.columns = cols_list  # type: ignore
 
         # Look for header rows
         header_rows = self._find_header_rows(df, cols_list)
@@ -56,87 +68,98 @@ def _infer_column_index(self, df: pd.DataFrame) -> pd.DataFrame:
 
         # Use headers to determine index columns
         else:
-            cols_df, index_cols = self._index_columns_from_header_rows(
+            header, index_cols = self._index_columns_from_header_rows(
                 df,
                 cols_list,
                 header_rows,
             )
 
             # Create a multi-index if necessary
-            if len(cols_df.index) > 1:
-                cols_df = cols_df.set_index(list(cols_df.columns[index_cols]))  # type: ignore
-                cols_mi = pd.MultiIndex.from_tuples(zip(*cols_df.values))
-
-                df = df.iloc[header_rows:, :]
-                df = df.set_index(list(df.columns[index_cols]))  # type: ignore
+            if len(header) > 1:
+                value_cols = np.delete(np.arange(len(cols_list)), index_cols)
+                cols_mi = pd.MultiIndex.from_arrays(list(header[:, value_cols]))
+
+                # Take the data rows and value columns in one go, and index them
+                # by position so repeated column names can't be mistaken for keys
+                body = df.iloc[header_rows:]
+                keys = [body.iloc[:, i] for i in index_cols]
+                df = body.iloc[:, value_cols]
+                df.index = (
+                    pd.MultiIndex.from_arrays(keys)
+                    if len(keys) > 1
+                    else pd.Index(keys[0])
+                )
                 df.columns = cols_mi
 
         return df
 
     def _index_columns_from_repeat_column_names(self, cols_list: list) -> list[int]:
-        index_cols: list[int] = []
+        # Locations of the column names that only appear once
+        repeated = pd.Index(cols_list).duplicated(keep=False)
+        return np.flatnonzero(~repeated).tolist()
+
+    def _cleaned_header_matrix(
+        self,
+        df: pd.DataFrame,
+        cols_list: list,
+        header_rows: int,
+    ) -> np.ndarray:
+        # Column names on top of the header rows, as a small object matrix
+        header = np.empty((header_rows + 1, len(cols_list)), dtype=object)
+        header[0] = cols_list
+        header[1:] = df.iloc[:header_rows].to_numpy(dtype=object)
 
-        # Tally column names
-        tally = defaultdict(list)
-        for i, item in enumerate(cols_list):
-            tally[item].append(i)
+        # Blank header cells carry down the label above them
+        for row in range(1, header_rows + 1):
+            blank = pd.isna(header[row])
+            header[row, blank] = header[row - 1, blank]
 
-        # Append the locations with only one item
-        for locs in tally.values():
-            if len(locs) == 1:
-                index_cols.append(locs[0])
+        if self._pattern is not None:
+            # Clean each distinct label once
+            codes, labels = pd.factorize(header.ravel())
+            cleaned = np.array([self._clean(x) for x in labels], dtype=object)
+            header = cleaned[codes].reshape(header.shape)
 
-        return index_cols
+        return header
 
     def _index_columns_from_header_rows(
         self,
         df: pd.DataFrame,
         cols_list: list,
         header_rows: int,
-    ) -> tuple[pd.DataFrame, list[int]]:
-        pattern = self._pattern
-        repl = self._repl
-        index_cols: list[int] = []
-
-        cols_df = pd.DataFrame([cols_list], columns=cols_list)
-
-        headers = df.iloc[0:header_rows, :]
-        headers.columns = cols_df.columns
-        cols_df = pd.concat([cols_df, headers])
-        cols_df = cols_df.ffill(axis=0)
-
-        if pattern is not None:
-            cols_df = cols_df.map(lambda x: pattern.sub(repl, x))
-
-        for idx in range(len(cols_list)):
-            data = cols_list[idx]
-            column = cols_df.iloc[:, idx]
-            col_matches = True
-            for row in column:
-                if data != row:
-                    col_matches = False
-                    break
-
-            if col_matches:
-                index_cols.append(idx)
-        return cols_df, index_cols
+    ) -> tuple[np.ndarray, list[int]]:
+        header = self._cleaned_header_matrix(df, cols_list, header_rows)
+
+        # Index columns keep their name in every header row
+        names = np.asarray(cols_list, dtype=object)
+        col_matches = (header == names[None, :]).all(axis=0)
+        index_cols = np.flatnonzero(col_matches).tolist()
+        return header, index_cols
 
     def _find_header_rows(
         self,
         df: pd.DataFrame,
         cols_list: list,
     ) -> int:
-        header_rows = -1
-        while True:
-            header_rows += 1
-            data = df.iat[header_rows, 0]
-            if (
-                data == data  # Value is not NaN (NaN == NaN returns false)
-                and data != cols_list[0]
-            ):
-                break
-
-        return header_rows
+        first_col = df.iloc[:, 0]
+        n_rows = len(first_col.index)
+
+        # Header rows are blank or repeat the first column's name, the first row
+        # that is neither starts the data. Headers are usually few, so scan in
+        # growing windows instead of comparing the whole column up front
+        start, window = 0, 8
+        while start < n_rows:
+            values = first_col.iloc[start : start + window]
+            is_data = (values.notna() & values.ne(cols_list[0])).to_numpy(
+                dtype=bool,
+                na_value=False,
+            )
+            if is_data.any():
+                return start + int(is_data.argmax())
+            start += window
+            window *= 2
+
+        return n_rows
 
 
 if __name__ == "__main__":
@@ -0,0 +1,74 @@
+"""Module for writing processed data to CSV or Parquet output files."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from data_pull_tools.caching import obj_cols_to_str
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pandas import DataFrame, Index
+
+OUTPUT_SUFFIXES = frozenset({".csv", ".parquet"})
+
+
+def check_output_path(output_path: Path) -> Path:
+    """Check that the output format is supported, before any work is done for it.
+
+    Parameters
+    ----------
+    output_path : Path
+        The output file path, its extension chooses the format.
+
+    Returns
+    -------
+    Path
+        The unchanged `output_path`.
+
+    Raises
+    ------
+    NotImplementedError
+        If the file extension is not one of `OUTPUT_SUFFIXES`.
+    """
+    if output_path.suffix not in OUTPUT_SUFFIXES:
+        msg = "Unsupported output file extension '%s' found."
+        raise NotImplementedError(msg, output_path.suffix)
+    return output_path
+
+
+def write_output(
+    df: DataFrame,
+    output_path: Path,
+    *,
+    index: bool = False,
+    columns: Index | None = None,
+) -> None:
+    """Write a DataFrame to a CSV or Parquet file, chosen by the file extension.
+    Object columns are converted to strings for Parquet, see `obj_cols_to_str`.
+
+    Parameters
+    ----------
+    df : DataFrame
+        The data to write.
+    output_path : Path
+        The output file path, ending in ".csv" or ".parquet".
+    index : bool, optional
+        Whether to write the index, by default False.
+    columns : Index | None, optional
+        Only write these columns, by default None (all columns).
+
+    Raises
+    ------
+    NotImplementedError
+        If the file extension is not one of `OUTPUT_SUFFIXES`.
+    """
+    match check_output_path(output_path).suffix:
+        case ".csv":
+            # Select the columns at write time, rather than copying the frame
+            df.to_csv(output_path, columns=columns, index=index)
+        case ".parquet":
+            df = df if columns is None else df[columns]
+            df = obj_cols_to_str(df)
+            df.to_parquet(output_path, engine="fastparquet", index=index)
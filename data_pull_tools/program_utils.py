@@ -18,49 +18,25 @@ def dhs_to_odhs_names(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def prog_has_rates_caps(df: pd.DataFrame, age_details: pd.DataFrame) -> pd.DataFrame:
-    rate_columns = [
-        x for x in age_details.columns if isinstance(x, str) and "Rate" in x
-    ]
-    non_rate_columns = [
-        x for x in age_details.columns if isinstance(x, str) and "Rate" not in x
-    ]
+    # Partition the string columns in a single pass over the columns
+    rate_columns: list[str] = []
+    non_rate_columns: list[str] = []
+    for col in age_details.columns:
+        if isinstance(col, str):
+            (rate_columns if "Rate" in col else non_rate_columns).append(col)
 
     rates = age_details[rate_columns].dropna(how="all")
     capacities = age_details[non_rate_columns].dropna(how="all")
 
-    progs_with_rates = pd.Series(
-        rates.reset_index()["Record ID"].unique(),
-        name="Record ID",
-    )
-    progs_with_capacities = pd.Series(
-        capacities.reset_index()["Record ID"].unique(),
-        name="Record ID",
-    )
-
-    # Find programs that have rates
-    df = df.merge(
-        right=progs_with_rates,
-        how="left",
-        on="Record ID",
-        indicator=True,
-    ).drop_duplicates()
-
-    df["Has Rate"] = df["_merge"] != "left_only"
-    df = df[df["_merge"] != "right_only"]
-    df = df.drop("_merge", axis=1)
+    progs_with_rates = rates.index.unique(level="Record ID")
+    progs_with_capacities = capacities.index.unique(level="Record ID")
 
-    # Find programs that have capacities
-    df = df.merge(
-        right=progs_with_capacities,
-        how="left",
-        on="Record ID",
-        indicator=True,
-    ).drop_duplicates()
+    # Flag programs by membership rather than merging against each ID list
+    df = df.drop_duplicates(ignore_index=True)
+    df["Has Rate"] = df["Record ID"].isin(progs_with_rates)
+    df["Has Capacity"] = df["Record ID"].isin(progs_with_capacities)
 
-    df["Has Capacity"] = df["_merge"] != "left_only"
-    df = df[df["_merge"] != "right_only"]
-
-    return df.drop("_merge", axis=1)
+    return df
 
 
 def invalid_programs_mask(
@@ -69,14 +45,10 @@ def invalid_programs_mask(
 ) -> "pd.Series[bool]":
     invalid_masks = {
         "Status": df["Status"] != "Active",
-        "TEST In License": df["License"].str.contains(
-            "TEST",
-            regex=False,
-            case=False,
-        ),
-        "DUPLICATE In License": df["License"].str.contains(
-            "DUPLICATE",
-            regex=False,
+        # One regex pass over License covers both markers
+        "TEST or DUPLICATE In License": df["License"].str.contains(
+            "TEST|DUPLICATE",
+            regex=True,
             case=False,
         ),
         "Early Learning Hub": df["Provider Type"].str.contains(
@@ -91,11 +63,12 @@ def invalid_programs_mask(
     if not filter_status:
         invalid_masks.pop("Status")
 
-    mask = pd.Series([False] * len(df.index))
+    # OR the sub-masks into one buffer in place, missing values are valid
+    mask = np.zeros(len(df.index), dtype=bool)
     for val in invalid_masks.values():
-        mask |= val.fillna(False)
+        np.logical_or(mask, val.to_numpy(dtype=bool, na_value=False), out=mask)
 
-    return mask
+    return pd.Series(mask, index=df.index)
 
 
 def remove_invalid_programs(
@@ -109,6 +82,53 @@ def remove_invalid_programs(
     return df[~mask]
 
 
+# (Provider Type, License prefix, Regulation) -> Type Code
+# License prefixes are the upper-cased first two characters, or "IQY"
+_LICENSED_TYPE_CODES: dict[tuple[str, str, str], str] = {
+    ("Licensed Center", "CC", "Licensed Child Care Center"): "CC",
+    ("Licensed Home", "CF", "Certified Family Child Care"): "CF",
+    ("Licensed Home", "RF", "Registered Family Child Care"): "RF",
+    ("License Exempt Home", "RS", "Regulated Subsidy"): "RS",
+    ("License Exempt Home", "IQY", "Regulated Subsidy"): "RS",
+    ("License Exempt Center", "RS", "Regulated Subsidy"): "RS",
+    ("License Exempt Center", "IQY", "Regulated Subsidy"): "RS",
+    ("License Exempt Center", "PS", "Recorded Preschool Program"): "PSR",
+    ("License Exempt Center", "SA", "Recorded School Age Program"): "SAR",
+    ("License Exempt Center", "RA", "Recorded Agency"): "RA",
+    ("Interim Emergency Site", "RA", "Recorded Agency"): "RA",
+    ("License Exempt Center", "AP", "Unlicensed"): "AP",
+}
+
+# (Provider Type, Regulation, offers Preschool, offers School Age) -> Type Code
+# Only used for programs without a licensed type code
+_EXEMPT_TYPE_CODES: dict[tuple[str, str, bool, bool], str] = {
+    ("License Exempt Center", "Unlicensed", True, False): "PSE",
+    ("License Exempt Center", "Unlicensed", False, True): "SAE",
+    ("License Exempt Center", "Unlicensed", False, False): "CE",
+    ("License Exempt Center", "Unlicensed", True, True): "CE",
+    ("License Exempt Home", "Unlicensed", False, False): "FE",
+    ("License Exempt Home", "Unlicensed", True, False): "FE",
+    ("License Exempt Home", "Unlicensed", False, True): "FE",
+    ("License Exempt Home", "Unlicensed", True, True): "FE",
+}
+
+# Type code categories, in table order
+_TYPE_CODES = list(
+    dict.fromkeys([*_LICENSED_TYPE_CODES.values(), *_EXEMPT_TYPE_CODES.values()]),
+)
+_TYPE_CODE_TABLE = pd.MultiIndex.from_tuples(list(_LICENSED_TYPE_CODES))
+_EXEMPT_TYPE_CODE_TABLE = pd.MultiIndex.from_tuples(list(_EXEMPT_TYPE_CODES))
+
+
+def _category_codes(table: dict) -> np.ndarray:
+    # Trailing -1 so a missed lookup (-1) indexes straight to the N/A code
+    return np.array([*map(_TYPE_CODES.index, table.values()), -1])
+
+
+_TYPE_CODE_CATEGORIES = _category_codes(_LICENSED_TYPE_CODES)
+_EXEMPT_TYPE_CODE_CATEGORIES = _category_codes(_EXEMPT_TYPE_CODES)
+
+
 def type_code_programs(df: pd.DataFrame, dropna: bool = False) -> pd.DataFrame:
     class Col(Enum):
         PROV_TYPE = "Provider Type"
@@ -116,141 +136,38 @@ class Col(Enum):
         LIC = "License"
         REG = "Regulation"
 
-    # Clean columns of interest
-    for col in Col:
-        df[col.value] = df[col.value].str.strip()
-
-    # Create masks for re-use
-    masks: dict[Col, dict[str, pd.Series[bool]]] = {
-        Col.PROV_TYPE: {
-            "Licensed Home": (df[Col.PROV_TYPE.value] == "Licensed Home"),
-            "Licensed Center": (df[Col.PROV_TYPE.value] == "Licensed Center"),
-            "License Exempt Home": (df[Col.PROV_TYPE.value] == "License Exempt Home"),
-            "License Exempt Center": (
-                df[Col.PROV_TYPE.value] == "License Exempt Center"
-            ),
-            "Interim Emergency Site": (
-                df[Col.PROV_TYPE.value] == "Interim Emergency Site"
-            ),
-        },
-        Col.PROG_TYPES: {
-            "PS": df[Col.PROG_TYPES.value].str.contains(
-                "Preschool",
-                regex=False,
-                case=False,
-            ),
-            "SA": df[Col.PROG_TYPES.value].str.contains(
-                "School Age",
-                regex=False,
-                case=False,
-            ),
-        },
-        Col.LIC: {
-            "CC": df[Col.LIC.value].str[:2].str.upper() == "CC",
-            "CF": df[Col.LIC.value].str[:2].str.upper() == "CF",
-            "RF": df[Col.LIC.value].str[:2].str.upper() == "RF",
-            "RS": df[Col.LIC.value].str[:2].str.upper() == "RS",
-            "PS": df[Col.LIC.value].str[:2].str.upper() == "PS",
-            "SA": df[Col.LIC.value].str[:2].str.upper() == "SA",
-            "RA": df[Col.LIC.value].str[:2].str.upper() == "RA",
-            "AP": df[Col.LIC.value].str[:2].str.upper() == "AP",
-            "IQY": df[Col.LIC.value].str[:3].str.upper() == "IQY",
-        },
-        Col.REG: {
-            "CC": df[Col.REG.value] == "Licensed Child Care Center",
-            "CF": df[Col.REG.value] == "Certified Family Child Care",
-            "RF": df[Col.REG.value] == "Registered Family Child Care",
-            "RS": df[Col.REG.value] == "Regulated Subsidy",
-            "PS": df[Col.REG.value] == "Recorded Preschool Program",
-            "SA": df[Col.REG.value] == "Recorded School Age Program",
-            "RA": df[Col.REG.value] == "Recorded Agency",
-            "UN": df[Col.REG.value] == "Unlicensed",
-        },
-    }
-
-    # Clean masks by filling NA's
-    for m_key, m_dict in masks.items():
-        for key, val in m_dict.items():
-            m_dict[key] = val.fillna(False)
-        masks[m_key] = m_dict
-
-    # Create conditions and replacements
-    replacement_conditions: dict[str, pd.Series[bool]] = {
-        "CC": (
-            (masks[Col.PROV_TYPE]["Licensed Center"])
-            & (masks[Col.LIC]["CC"])
-            & (masks[Col.REG]["CC"])
-        ),
-        "CF": (
-            (masks[Col.PROV_TYPE]["Licensed Home"])
-            & (masks[Col.LIC]["CF"])
-            & (masks[Col.REG]["CF"])
-        ),
-        "RF": (
-            (masks[Col.PROV_TYPE]["Licensed Home"])
-            & (masks[Col.LIC]["RF"])
-            & (masks[Col.REG]["RF"])
-        ),
-        "RS": (
-            (
-                (masks[Col.PROV_TYPE]["License Exempt Home"])
-                | (masks[Col.PROV_TYPE]["License Exempt Center"])
-            )
-            & ((masks[Col.LIC]["RS"]) | (masks[Col.LIC]["IQY"]))
-            & (masks[Col.REG]["RS"])
-        ),
-        "PSR": (
-            (masks[Col.PROV_TYPE]["License Exempt Center"])
-            & (masks[Col.LIC]["PS"])
-            & (masks[Col.REG]["PS"])
-        ),
-        "SAR": (
-            (masks[Col.PROV_TYPE]["License Exempt Center"])
-            & (masks[Col.LIC]["SA"])
-            & (masks[Col.REG]["SA"])
-        ),
-        "RA": (
-            (
-                (masks[Col.PROV_TYPE]["License Exempt Center"])
-                | (masks[Col.PROV_TYPE]["Interim Emergency Site"])
-            )
-            & (masks[Col.LIC]["RA"])
-            & (masks[Col.REG]["RA"])
-        ),
-        "AP": (
-            (masks[Col.PROV_TYPE]["License Exempt Center"])
-            & (masks[Col.LIC]["AP"])
-            & (masks[Col.REG]["UN"])
-        ),
-        "PSE": (
-            (masks[Col.PROV_TYPE]["License Exempt Center"])
-            & (masks[Col.PROG_TYPES]["PS"] & ~masks[Col.PROG_TYPES]["SA"])
-            & (masks[Col.REG]["UN"])
-        ),
-        "SAE": (
-            (masks[Col.PROV_TYPE]["License Exempt Center"])
-            & (~masks[Col.PROG_TYPES]["PS"] & masks[Col.PROG_TYPES]["SA"])
-            & (masks[Col.REG]["UN"])
-        ),
-        "CE": (
-            (masks[Col.PROV_TYPE]["License Exempt Center"])
-            & ~(masks[Col.PROG_TYPES]["PS"] ^ masks[Col.PROG_TYPES]["SA"])
-            & (masks[Col.REG]["UN"])
-        ),
-        "FE": (masks[Col.PROV_TYPE]["License Exempt Home"]) & (masks[Col.REG]["UN"]),
-    }
+    # Clean columns of interest, leaving the input columns untouched
+    prov_type, prog_types, lic, reg = (df[col.value].str.strip() for col in Col)
 
-    # Break into component parts for numpy
-    replacements = list(replacement_conditions.keys())
-    conditions = list(replacement_conditions.values())
+    # Upper-case the longest prefix once, the two character prefix is cut from it
+    lic3 = lic.str[:3].str.upper()
+    is_iqy = (lic3 == "IQY").fillna(False)  # noqa: FBT003
+    lic_prefix = lic3.str[:2].mask(is_iqy, "IQY")
 
-    # Convert conditions from a boolean series to a boolean nupmy array
-    for count, _ in enumerate(conditions):
-        conditions[count] = np.array(conditions[count], dtype=bool)  # type: ignore
+    # Look up licensed programs first, the exempt table only covers the rest
+    codes = _TYPE_CODE_CATEGORIES[
+        _TYPE_CODE_TABLE.get_indexer(
+            pd.MultiIndex.from_arrays([prov_type, lic_prefix, reg]),
+        )
+    ]
+    unmatched = codes == -1
+    if unmatched.any():
+        ps = prog_types.str.contains("Preschool", regex=False, case=False)
+        sa = prog_types.str.contains("School Age", regex=False, case=False)
+        exempt_rows = _EXEMPT_TYPE_CODE_TABLE.get_indexer(
+            pd.MultiIndex.from_arrays(
+                [
+                    prov_type,
+                    reg,
+                    ps.to_numpy(dtype=bool, na_value=False),
+                    sa.to_numpy(dtype=bool, na_value=False),
+                ],
+            ),
+        )
+        codes[unmatched] = _EXEMPT_TYPE_CODE_CATEGORIES[exempt_rows[unmatched]]
 
-    # Apply type coding
-    df["Type Code"] = ""
-    df["Type Code"] = np.select(conditions, replacements, default=None)  # type: ignore
+    # Unmatched programs keep code -1, which is N/A
+    df["Type Code"] = pd.Categorical.from_codes(codes, categories=_TYPE_CODES)
 
     # Remove N/A type codes
     if dropna:
@@ -260,25 +177,16 @@ class Col(Enum):
     return df
 
 
-def sda_code_programs(df: pd.DataFrame) -> pd.DataFrame:
-    masks: dict[int, pd.Series[bool]] = {}
-    for region in RegionEnum:
-        val = region.value
-        sda = val.sda
-        name = val.region
-        masks[sda] = (df["Region"].str.strip() == name).fillna(False)
-
-    # Break into component parts for numpy
-    replacements = list(masks.keys())
-    conditions = list(masks.values())
+# Region names and their SDA, with a trailing None for unmatched regions
+_SDA_REGIONS = pd.Index([region.value.region for region in RegionEnum])
+_SDAS = np.array([*(region.value.sda for region in RegionEnum), None], dtype=object)
 
-    # Convert conditions from a boolean series to a boolean nupmy array
-    for count, _ in enumerate(conditions):
-        conditions[count] = np.array(conditions[count], dtype=bool)  # type: ignore
 
-    # Apply SDA coding
-    df["SDA"] = ""
-    df["SDA"] = np.select(conditions, replacements, default=None)  # type: ignore
+def sda_code_programs(df: pd.DataFrame) -> pd.DataFrame:
+    # One hash lookup per row instead of one equality pass per region
+    # A missed lookup (-1) indexes straight to None
+    positions = _SDA_REGIONS.get_indexer(df["Region"].str.strip())
+    df["SDA"] = _SDAS[positions]
 
     return df
 
@@ -300,12 +208,14 @@ class ProgramType(Enum):
 
 def flag_program_types(df: pd.DataFrame) -> pd.DataFrame:
     df["Program Types"] = df["Program Types"].str.strip()
+    # Upper-case once and match case-sensitively, rather than having every
+    # case-insensitive search upper-case the whole column again
+    program_types = df["Program Types"].str.upper()
     for prog_type in ProgramType:
-        mask = (
-            df["Program Types"]
-            .str.contains(prog_type.value, regex=False, case=False)
-            .fillna(False)
-        )
+        mask = program_types.str.contains(
+            prog_type.value.upper(),
+            regex=False,
+        ).fillna(False)
         df[prog_type.value] = mask
     return df
 
@@ -367,9 +277,7 @@ def care_for_flag_from_total_months(df: pd.DataFrame) -> pd.DataFrame:
         l_bound = a_range.lower_bound
         u_bound = a_range.upper_bound
 
-        mask = valid_range_mask.copy()
-
-        mask &= (l_bound <= df[to_months]).fillna(False)  # noqa: FBT003
+        mask = valid_range_mask & (l_bound <= df[to_months]).fillna(False)  # noqa: FBT003
         if u_bound is not None:
             mask &= (df[from_months] < u_bound).fillna(False)  # noqa: FBT003
 
@@ -17,6 +17,7 @@
     ExcelReader,
     ResolveStrategyType,
 )
+from data_pull_tools.output_utils import check_output_path, write_output
 
 module_logger = logging.getLogger(__name__)
 
@@ -65,19 +66,12 @@ def clean_referral_action_logs(df: DataFrame) -> DataFrame:
     df = df.drop_duplicates()
 
     group = ["ReferralID", "Date of Action"]
-    mask = df[_search_in_minute] > _max_searches_per_minute
     # Find all groups of records that have too many searches per minute
-    erroneous_groups = (
-        df.loc[mask, group]
-        .groupby(group)
-        .size()
-        .reset_index(name="Count")
-        .drop("Count", axis=1)
+    erroneous = (
+        df.groupby(group)[_search_in_minute].transform("max") > _max_searches_per_minute
     )
-    df = df.merge(erroneous_groups, how="outer", on=group, indicator=True)
-    # Only keep record groups not part of the erroneous_groups set
-    df = df[df["_merge"] == "left_only"]
-    return df.drop("_merge", axis=1)
+    # Only keep record groups not part of the erroneous set, ordered by group
+    return df[~erroneous].sort_values(group, kind="stable", ignore_index=True)
 
 
 def try_parse_filters(s):
@@ -94,7 +88,9 @@ def try_parse_filters(s):
 
 def process_referral_notes(df: DataFrame) -> DataFrame:
     df = df.loc[df["Notes"].notna()]
-    df["Notes"] = df["Notes"].apply(try_parse_filters)
+    # Assign onto a new frame, setting a column on the filtered slice would trigger
+    # pandas' chained-assignment check (and its SettingWithCopyWarning)
+    df = df.assign(Notes=df["Notes"].apply(try_parse_filters))
     df = df.loc[df["Notes"].notna()]
 
     df = df.explode("Notes").reset_index(drop=True)
@@ -162,7 +158,34 @@ def _read_action_logs(
 
 def process_referrals(
     process_root: Path,
+    output_path: Path | None = None,
 ) -> None:
+    """Process referral searches from action log Excel files and save the results.
+
+    Parameters
+    ----------
+    process_root : Path
+        The root path for processing, either the batch directory or a
+        single file.
+    output_path : Path | None, optional
+        Where to write the processed referrals, by default "ProcessedReferrals.csv"
+        in the processed directory. The format is chosen by the file extension,
+        either ".csv" or ".parquet". The parsed filters are written next to it, as
+        "ProcessedReferralFiltersOnly" in the same format.
+
+    Raises
+    ------
+    NotImplementedError
+        If `output_path` has an unsupported file extension, raised before any
+        action logs are read.
+    """
+    root_dir = process_root.parent if process_root.is_file() else process_root
+    # Fail before reading, rather than after all the work is done
+    output_path = check_output_path(
+        output_path or root_dir / "ProcessedReferrals.csv",
+    )
+    filters_path = output_path.with_stem("ProcessedReferralFiltersOnly")
+
     module_logger.info("Reading action logs from '%s'", process_root)
     part = partial(_read_action_logs, process_root)
     action_logs = measure_function(
@@ -172,9 +195,6 @@ def process_referrals(
         ("row", "rows"),
     )
 
-    if process_root.is_file():
-        process_root = process_root.parent
-
     module_logger.info("Processing action logs")
     part = partial(process_referral_action_logs, action_logs)
     action_logs = measure_function(
@@ -195,9 +215,10 @@ def process_referrals(
     )
 
     module_logger.debug("Saving referrals")
-    action_logs.drop("Notes", axis=1).to_csv(
-        process_root / "ProcessedReferrals.csv",
-        index=False,
+    write_output(
+        action_logs,
+        output_path,
+        columns=action_logs.columns.drop("Notes"),
     )
     module_logger.debug("Save successful")
 
@@ -211,10 +232,7 @@ def process_referrals(
     )
 
     module_logger.debug("Saving filters")
-    notes.to_csv(
-        process_root / "ProcessedReferralFiltersOnly.csv",
-        index=False,
-    )
+    write_output(notes, filters_path)
     module_logger.debug("Save successful")
 
 
@@ -0,0 +1,19 @@
+from pathlib import Path
+
+import pandas as pd
+from data_pull_tools.output_utils import write_output
+
+
+def test_write_output_parquet_mixed_objects(tmp_path: Path) -> None:
+    df = pd.DataFrame({"Value": [["Infant", "Toddler"], 97201, {"Zip": 97201}, None]})
+    output_path = tmp_path / "output.parquet"
+
+    write_output(df, output_path)
+
+    result = pd.read_parquet(output_path, engine="fastparquet")
+    assert result["Value"].tolist()[:3] == [
+        '["Infant", "Toddler"]',
+        "97201",
+        '{"Zip": 97201}',
+    ]
+    assert result["Value"].isna().tolist() == [False, False, False, True]